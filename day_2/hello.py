@@ -3,8 +3,15 @@
 import sys
 
 
+def read_line(prompt: str) -> str:
+    """Show prompt and return the line the user types, without surrounding whitespace."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
+
+
 def get_name(prompt: str = "Enter a name: ") -> str:
-    name = input(prompt).strip()
+    name = read_line(prompt)
     if not name:
         print("Error: name cannot be empty.")
         sys.exit(1)
@@ -13,7 +20,7 @@ def get_name(prompt: str = "Enter a name: ") -> str:
 
 def get_count(prompt: str = "How many times? ") -> int:
     try:
-        val = int(input(prompt).strip())
+        val = int(read_line(prompt))
     except Exception:
         print("Error: please enter a whole number for the count.")
         sys.exit(1)
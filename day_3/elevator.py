@@ -3,9 +3,16 @@
 import sys
 
 
+def read_line(prompt: str) -> str:
+    """Show prompt and return the line the user types, without surrounding whitespace."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
+
+
 def get_floor(prompt: str, min_floor: int = 0, max_floor: int = 30) -> int:
     try:
-        val = int(input(prompt).strip())
+        val = int(read_line(prompt))
     except Exception:
         print(f"Error: please enter a whole number between {min_floor} and {max_floor} for the floor.")
         sys.exit(1)
@@ -4,9 +4,16 @@ import sys
 from typing import Optional
 
 
+def read_line(prompt: str) -> str:
+    """Show prompt and return the line the user types, without surrounding whitespace."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
+
+
 def get_floor(prompt: str, min_floor: int = 0, max_floor: int = 30, excluded: Optional[int] = None) -> int:
     try:
-        val = int(input(prompt).strip())
+        val = int(read_line(prompt))
     except Exception:
         print(f"Error: please enter a whole number between {min_floor} and {max_floor} for the floor.")
         sys.exit(1)
@@ -21,7 +28,7 @@ def get_floor(prompt: str, min_floor: int = 0, max_floor: int = 30, excluded: Op
 
 def main() -> None:
     # Ask the user which floor to ignore (blank for none)
-    raw = input("Enter floor to ignore (0-30) or press Enter for none: ").strip()
+    raw = read_line("Enter floor to ignore (0-30) or press Enter for none: ")
     excluded: Optional[int] = None
     if raw:
         try:
@@ -51,8 +58,10 @@ def main() -> None:
     else:
         direction = "up" if diff > 0 else "down"
         floors = abs(diff)
-        # If the trip crosses the non-existent floor, subtract one physical floor
-        if excluded is not None and ((current < excluded < dest) or (dest < excluded < current)):
+        # If the trip crosses the non-existent floor, subtract one physical floor.
+        # The trip crosses it exactly when current and dest sit on opposite sides, i.e. the two
+        # offsets have opposite signs (their xor is negative); get_floor never returns excluded itself.
+        if excluded is not None and ((current - excluded) ^ (dest - excluded)) < 0:
             floors -= 1
         floor_word = "floor" if floors == 1 else "floors"
         print(f"Direction: {direction}, {floors} {floor_word}")
@@ -14,16 +14,20 @@ Usage examples:
 from __future__ import annotations
 
 import argparse
-import math
+import os
 import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import permutations, repeat
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 # Threshold for attempting exact enumeration of all valid event orders
 EXACT_ENUM_LIMIT = 6  # safe for typical machines; increases work factor quickly
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Passenger:
     id: int
     pickup: int
@@ -31,46 +35,72 @@ class Passenger:
     name: Optional[str] = None
 
 
-Event = Tuple[str, int]  # ('p' or 'd', passenger_id)
+# An event packs (passenger index << 1) | PICK/DROP into one int, where the index is the
+# passenger's position in the passengers sequence: no tuple per event, and an event indexes
+# straight into the per-scenario floor table built by event_floors.
+Event = int
+PICK = 0
+DROP = 1
+Score = Tuple[int, int, int, int]  # (total_travel, total_pickup_wait, max_pickup_wait, total_arrival_time)
 
+OBJECTIVES = ('min_avg_pickup_wait', 'min_max_pickup_wait', 'min_total_travel', 'min_avg_arrival_time')
 
-def simulate_events(events: Sequence[Event], start: int, passengers: Sequence[Passenger]) -> Dict:
-    """Simulate elevator moving through the given events (list of ('p'/'d', id)).
 
+def encode_event(typ: int, index: int) -> Event:
+    """Pack an event kind (PICK or DROP) and passenger index into one Event."""
+    return (index << 1) | typ
+
+
+def event_floors(passengers: Sequence[Passenger]) -> List[int]:
+    """Return the floor of every event, indexed by the encoded Event (pickup, drop, pickup, ...)."""
+    floors: List[int] = []
+    for p in passengers:
+        floors.append(p.pickup)
+        floors.append(p.drop)
+    return floors
+
+
+def simulate_events(events: Sequence[Event], start: int, floors: Sequence[int]) -> Dict:
+    """Simulate elevator moving through the given events (encoded Events).
+
+    floors is the event floor table from event_floors; build it once per scenario.
     Returns metrics dict including total_travel, pickup_times, arrival_times, total_pickup_wait, etc.
+    pickup_times/arrival_times are lists by passenger index (None if the event is missing).
     Time is measured as floors travelled (1 per floor).
     """
-    pos_map = {('p', p.id): p.pickup for p in passengers}
-    pos_map.update({('d', p.id): p.drop for p in passengers})
-
+    n = len(floors) >> 1
     time = 0
     cur = start
-    pickup_times: Dict[int, int] = {}
-    arrival_times: Dict[int, int] = {}
+    pickup_times: List[Optional[int]] = [None] * n
+    arrival_times: List[Optional[int]] = [None] * n
 
     # If the first event is at a different floor, travel there first
     for ev in events:
-        floor = pos_map[ev]
+        floor = floors[ev]
         time += abs(floor - cur)
         cur = floor
-        typ, pid = ev
-        if typ == 'p':
-            pickup_times[pid] = time
+        if ev & DROP:
+            arrival_times[ev >> 1] = time
         else:
-            arrival_times[pid] = time
+            pickup_times[ev >> 1] = time
 
     total_travel = time
 
-    waits = {pid: pickup_times.get(pid, math.inf) for pid in [p.id for p in passengers]}
-    arrivals = {pid: arrival_times.get(pid, math.inf) for pid in [p.id for p in passengers]}
-
-    total_pickup_wait = sum(v if v != math.inf else 0 for v in waits.values())
-    max_pickup_wait = max(v if v != math.inf else 0 for v in waits.values()) if waits else 0
-    avg_pickup_wait = total_pickup_wait / len(waits) if waits else 0
-
-    total_arrival_time = sum(v if v != math.inf else 0 for v in arrivals.values())
-    max_arrival_time = max(v if v != math.inf else 0 for v in arrivals.values()) if arrivals else 0
-    avg_arrival_time = total_arrival_time / len(arrivals) if arrivals else 0
+    # passengers missing from events count as 0 towards the totals and maxima
+    total_pickup_wait = max_pickup_wait = 0
+    total_arrival_time = max_arrival_time = 0
+    for v in pickup_times:
+        if v is not None:
+            total_pickup_wait += v
+            if v > max_pickup_wait:
+                max_pickup_wait = v
+    for v in arrival_times:
+        if v is not None:
+            total_arrival_time += v
+            if v > max_arrival_time:
+                max_arrival_time = v
+    avg_pickup_wait = total_pickup_wait / n if n else 0
+    avg_arrival_time = total_arrival_time / n if n else 0
 
     return {
         'events': events,
@@ -85,93 +115,210 @@ def simulate_events(events: Sequence[Event], start: int, passengers: Sequence[Pa
     }
 
 
-def generate_valid_event_orders(passengers: Sequence[Passenger]) -> Iterable[List[Event]]:
-    """Generate all valid event orders (pickup before drop for each passenger).
+def score_candidates(
+    candidates: Iterable[Sequence[Event]],
+    start: int,
+    floors: Sequence[int],
+    best_keys: List[Optional[Tuple[int, ...]]],
+    best_seqs: List[Optional[Sequence[Event]]],
+) -> None:
+    """Score every candidate in one tight loop, updating the bests in place.
 
-    Warning: count grows very fast (combinatorial). Only use with small number of passengers.
+    Much cheaper than simulate_events: only the travel, wait and arrival sums are kept, and
+    update_best only runs for candidates that improve at least one objective.
     """
-    n = len(passengers)
-    if n == 0:
-        yield []
-        return
+    for seq in candidates:
+        time = 0
+        cur = start
+        total_pickup_wait = 0
+        max_pickup_wait = 0
+        total_arrival_time = 0
+        for ev in seq:
+            floor = floors[ev]
+            time += abs(floor - cur)
+            cur = floor
+            if ev & DROP:
+                total_arrival_time += time
+            else:
+                total_pickup_wait += time
+                if time > max_pickup_wait:
+                    max_pickup_wait = time
+        if (
+            best_keys[0] is None
+            or (total_pickup_wait, time) < best_keys[0]
+            or (max_pickup_wait, total_pickup_wait, time) < best_keys[1]
+            or (time,) < best_keys[2]
+            or (total_arrival_time, time) < best_keys[3]
+        ):
+            update_best(best_keys, best_seqs, seq, (time, total_pickup_wait, max_pickup_wait, total_arrival_time))
+
+
+def objective_keys(score: Score) -> Tuple[Tuple[int, ...], ...]:
+    """Return one sort key per objective (same order as OBJECTIVES); smaller is better.
+
+    Averages are compared through their sums (the passenger count is fixed), with total travel as tie-breaker.
+    """
+    travel, total_wait, max_wait, total_arrival = score
+    return (
+        (total_wait, travel),
+        (max_wait, total_wait, travel),
+        (travel,),
+        (total_arrival, travel),
+    )
+
+
+def update_best(best_keys: List[Optional[Tuple[int, ...]]], best_seqs: List[Optional[Sequence[Event]]], seq: Sequence[Event], score: Score) -> None:
+    """Record seq as the best for every objective it strictly improves (earlier candidates win ties)."""
+    for i, key in enumerate(objective_keys(score)):
+        if best_keys[i] is None or key < best_keys[i]:
+            best_keys[i] = key
+            best_seqs[i] = seq
+
+
+def search_event_orders(
+    start: int,
+    floors: Sequence[int],
+    best_keys: List[Optional[Tuple[int, ...]]],
+    best_seqs: List[Optional[Sequence[Event]]],
+) -> None:
+    """Search all valid event orders (pickup before drop for each passenger), updating the bests in place.
+
+    Branch-and-bound: every DFS node carries its partial travel, wait and arrival sums, and a prefix is
+    abandoned once lower bounds show that no completion can improve any objective's incumbent.
+    Warning: worst case still grows very fast (combinatorial). Only use with small number of passengers.
+    """
+    n = len(floors) >> 1
 
-    # quick guard
+    # quick guard (empty and one-passenger scenarios never get here: find_best_sequences answers them directly)
     if n > EXACT_ENUM_LIMIT:
         raise ValueError(f"Too many passengers ({n}) for exact enumeration; use heuristics instead")
 
-    picked = set()
-    dropped = set()
-
-    id_list = [p.id for p in passengers]
+    total = 2 * n
+    full = (1 << n) - 1
+    picks = [encode_event(PICK, i) for i in range(n)]
+    drop_events = [encode_event(DROP, i) for i in range(n)]
+    pick_floor = floors[0::2]
+    drop_floor = floors[1::2]
+    ride = [abs(drop_floor[i] - pick_floor[i]) for i in range(n)]
+
+    # Iterative DFS with an explicit stack instead of recursive generators. Each entry is
+    # (depth, event, picked, dropped, floor, time, total_wait, max_wait, total_arrival): event goes
+    # into seq[depth], and the rest is the state *after* that event, with picked/dropped as bitsets
+    # over passenger positions. Children are pushed highest bit first so they pop in the same order
+    # as a recursive walk, which keeps tie-breaks stable.
+    seq: List[Event] = [picks[0]] * total
+    stack = []
+    for i in reversed(range(n)):
+        t = abs(pick_floor[i] - start)
+        stack.append((0, picks[i], 1 << i, 0, pick_floor[i], t, t, t, 0))
+    while stack:
+        depth, ev, picked, dropped, cur, time, total_wait, max_wait, total_arrival = stack.pop()
+        seq[depth] = ev
+        depth += 1
+        if depth == total:
+            update_best(best_keys, best_seqs, list(seq), (time, total_wait, max_wait, total_arrival))
+            continue
 
-    def backtrack(seq: List[Event]):
-        if len(seq) == 2 * n:
-            yield list(seq)
-            return
+        # Bound: every remaining stop is at least its direct distance away, and the elevator must
+        # sweep the whole span of remaining floors. Prune only if no objective can still improve.
+        if best_keys[0] is not None:
+            lb_wait = total_wait
+            lb_max = max_wait
+            lb_arrival = total_arrival
+            lo = hi = cur
+            avail = full & ~picked
+            while avail:
+                i = avail.bit_length() - 1
+                avail ^= 1 << i
+                floor = pick_floor[i]
+                reach = time + abs(floor - cur)
+                lb_wait += reach
+                if reach > lb_max:
+                    lb_max = reach
+                lb_arrival += reach + ride[i]
+                lo = min(lo, floor, drop_floor[i])
+                hi = max(hi, floor, drop_floor[i])
+            avail = picked & ~dropped
+            while avail:
+                i = avail.bit_length() - 1
+                avail ^= 1 << i
+                floor = drop_floor[i]
+                lb_arrival += time + abs(floor - cur)
+                lo = min(lo, floor)
+                hi = max(hi, floor)
+            lb_travel = time + (hi - lo) + min(cur - lo, hi - cur)
+            if (
+                lb_wait > best_keys[0][0]
+                and lb_max > best_keys[1][0]
+                and lb_travel >= best_keys[2][0]
+                and lb_arrival > best_keys[3][0]
+            ):
+                continue
+
+        # we can drop any passenger already picked but not yet dropped (pushed first, popped last)
+        avail = picked & ~dropped
+        while avail:
+            i = avail.bit_length() - 1
+            bit = 1 << i
+            avail ^= bit
+            floor = drop_floor[i]
+            t = time + abs(floor - cur)
+            stack.append((depth, drop_events[i], picked, dropped | bit, floor, t, total_wait, max_wait, total_arrival + t))
         # we can pick up any passenger not yet picked
-        for pid in id_list:
-            if pid not in picked:
-                # pick pid
-                picked.add(pid)
-                seq.append(('p', pid))
-                yield from backtrack(seq)
-                seq.pop()
-                picked.remove(pid)
-        # we can drop any passenger already picked but not yet dropped
-        for pid in id_list:
-            if pid in picked and pid not in dropped:
-                dropped.add(pid)
-                seq.append(('d', pid))
-                yield from backtrack(seq)
-                seq.pop()
-                dropped.remove(pid)
-
-    yield from backtrack([])
-
-
-def build_sequence_from_pickup_order(start: int, passengers: Sequence[Passenger], pickup_order: Sequence[int], drop_policy: str = 'defer_nearest') -> List[Event]:
-    """Construct a sequence of events from an ordering of pickups.
-
-    drop_policy:
-      - 'defer_nearest': after finishing pickups, service drops by greedy nearest-first
-      - 'immediate': after picking a passenger, immediately go to their drop (in place)
+        avail = full & ~picked
+        while avail:
+            i = avail.bit_length() - 1
+            bit = 1 << i
+            avail ^= bit
+            floor = pick_floor[i]
+            t = time + abs(floor - cur)
+            stack.append((depth, picks[i], picked | bit, dropped, floor, t, total_wait + t, max(max_wait, t), total_arrival))
+
+
+@lru_cache(maxsize=None)
+def greedy_drop_tail(cur_floor: int, undropped: Tuple[Tuple[int, int], ...]) -> Tuple[Tuple[int, ...], int]:
+    """Serve drops greedily (nearest-first) from cur_floor; returns (passenger indices in drop order, added travel).
+
+    undropped holds (passenger_index, drop_floor) pairs sorted by index, so ties go to the lowest index.
+    Memoized on the entry state (last pickup floor, undropped set), which pickup orders ending on the
+    same passenger share; find_best_sequences clears the cache when it is done.
     """
-    seq: List[Event] = []
-    cur = start
-
-    picked = set()
-    undropped = set()
-
-    # perform pickups in the provided order
-    for pid in pickup_order:
-        seq.append(('p', pid))
-        picked.add(pid)
-        undropped.add(pid)
-        if drop_policy == 'immediate':
-            seq.append(('d', pid))
-            undropped.remove(pid)
-    # if drops remain, service them greedily (nearest-first) from current position after last pickup
-    if undropped:
-        # compute current position after pickups
-        if seq:
-            # find position of last event
-            last_ev = seq[-1]
-            # determine floor
-            last_floor = next((p.drop if last_ev[0] == 'd' else p.pickup for p in passengers if p.id == last_ev[1]), start)
-        else:
-            last_floor = start
-        remaining = set(undropped)
-        cur_floor = last_floor
-        while remaining:
-            # choose passenger whose drop is nearest to cur_floor
-            pid = min(remaining, key=lambda pidx: abs(next(p.drop for p in passengers if p.id == pidx) - cur_floor))
-            seq.append(('d', pid))
-            cur_floor = next(p.drop for p in passengers if p.id == pid)
-            remaining.remove(pid)
+    remaining = list(undropped)
+    order: List[int] = []
+    travel = 0
+    while remaining:
+        # explicit scan instead of min(key=lambda): no call per candidate, and strict < keeps the lowest index on ties
+        best = 0
+        best_dist = abs(remaining[0][1] - cur_floor)
+        for k in range(1, len(remaining)):
+            dist = abs(remaining[k][1] - cur_floor)
+            if dist < best_dist:
+                best, best_dist = k, dist
+        idx, cur_floor = remaining.pop(best)
+        order.append(idx)
+        travel += best_dist
+    return tuple(order), travel
+
+
+def build_sequence_from_pickup_order(
+    floors: Sequence[int],
+    pickup_order: Sequence[int],
+) -> List[Event]:
+    """Construct a sequence of events from an ordering of pickups (passenger indices).
+
+    All pickups happen first, in the given order; drops are then serviced greedily (nearest-first)
+    from the last pickup floor. (The 'immediate' policy, each drop right after its pickup, is just
+    the interleaved list and is built inline where it is needed.)
+    """
+    seq = [encode_event(PICK, i) for i in pickup_order]
+    if not seq:
+        return seq
+    tail, _ = greedy_drop_tail(floors[seq[-1]], tuple(sorted((i, floors[encode_event(DROP, i)]) for i in pickup_order)))
+    seq.extend(encode_event(DROP, i) for i in tail)
     return seq
 
 
-def heuristics_for_large_n(start: int, passengers: Sequence[Passenger], tries: int = 200) -> List[List[Event]]:
+def heuristics_for_large_n(start: int, floors: Sequence[int], tries: int = 200) -> List[List[Event]]:
     """Return a list of candidate event sequences from simple heuristics for larger N.
 
     Strategies:
@@ -179,119 +326,120 @@ def heuristics_for_large_n(start: int, passengers: Sequence[Passenger], tries: i
       - farthest pickup first (FPF)
       - random pickup orders with greedy drop service
     """
-    ids = [p.id for p in passengers]
+    indices = list(range(len(floors) >> 1))
     candidates: List[List[Event]] = []
 
     # nearest pickup first
-    ids_sorted_nearest = sorted(ids, key=lambda pid: abs(next(p.pickup for p in passengers if p.id == pid) - start))
-    candidates.append(build_sequence_from_pickup_order(start, passengers, ids_sorted_nearest, drop_policy='defer_nearest'))
+    sorted_nearest = sorted(indices, key=lambda i: abs(floors[encode_event(PICK, i)] - start))
+    candidates.append(build_sequence_from_pickup_order(floors, sorted_nearest))
 
     # farthest pickup first
-    ids_sorted_far = list(reversed(ids_sorted_nearest))
-    candidates.append(build_sequence_from_pickup_order(start, passengers, ids_sorted_far, drop_policy='defer_nearest'))
+    sorted_far = list(reversed(sorted_nearest))
+    candidates.append(build_sequence_from_pickup_order(floors, sorted_far))
 
     # try random pickups
     for _ in range(min(tries, 500)):
-        order = ids[:]
+        order = indices[:]
         random.shuffle(order)
-        candidates.append(build_sequence_from_pickup_order(start, passengers, order, drop_policy='defer_nearest'))
+        candidates.append(build_sequence_from_pickup_order(floors, order))
 
     return candidates
 
 
+def score_pickup_permutations(
+    start: int, floors: Sequence[int], first: int
+) -> Tuple[List[Optional[Tuple[int, ...]]], List[Optional[Sequence[Event]]]]:
+    """Build and score both drop policies for every pickup order that starts with passenger `first`.
+
+    One chunk of the pickup-permutation pass, runnable in a worker process. Returns this chunk's
+    (best_keys, best_seqs); chunks are visited in the same order as a serial pass would.
+    """
+    best_keys: List[Optional[Tuple[int, ...]]] = [None] * len(OBJECTIVES)
+    best_seqs: List[Optional[Sequence[Event]]] = [None] * len(OBJECTIVES)
+    rest = [i for i in range(len(floors) >> 1) if i != first]
+
+    def candidates():
+        for perm in permutations(rest):
+            order = (first,) + perm
+            yield build_sequence_from_pickup_order(floors, order)
+            # 'immediate' policy: each drop straight after its pickup
+            yield [ev for i in order for ev in (encode_event(PICK, i), encode_event(DROP, i))]
+
+    score_candidates(candidates(), start, floors, best_keys, best_seqs)
+    return best_keys, best_seqs
+
+
 def find_best_sequences(start: int, passengers: Sequence[Passenger]) -> Dict[str, Dict]:
     """Find best sequences for different objectives.
 
     Returns a dict mapping objective string to best result (metrics + sequence).
     Objectives: 'min_avg_pickup_wait', 'min_max_pickup_wait', 'min_total_travel', 'min_avg_arrival_time'
+    Events in the results are encoded Events (see encode_event).
     """
     n = len(passengers)
-    candidates: List[List[Event]] = []
+    floors = event_floors(passengers)
+
+    # Nothing to search: with at most one passenger the only valid sequence is trivially the best
+    if n <= 1:
+        seq = [encode_event(PICK, 0), encode_event(DROP, 0)] if n else []
+        metrics = simulate_events(seq, start, floors)
+        return {name: metrics for name in OBJECTIVES}
+
+    # Heuristic candidates as dict keys: duplicates (e.g. repeated random orders) are scored
+    # once, and insertion order keeps tie-breaks stable
+    candidates: Dict[Tuple[Event, ...], None] = {}
+
+    # Best sort key and sequence per objective (same order as OBJECTIVES)
+    best_keys: List[Optional[Tuple[int, ...]]] = [None] * len(OBJECTIVES)
+    best_seqs: List[Optional[Sequence[Event]]] = [None] * len(OBJECTIVES)
 
     if n <= EXACT_ENUM_LIMIT:
-        # Enumerate all valid event orders (may be large but reasonable for small n)
-        for ev in generate_valid_event_orders(passengers):
-            candidates.append(ev)
+        # Search all valid event orders, pruning prefixes that cannot beat the current bests
+        search_event_orders(start, floors, best_keys, best_seqs)
     else:
         # Use heuristics for candidate sequences
-        candidates.extend(heuristics_for_large_n(start, passengers))
-
-    # Also include sequences built from pickup permutations for moderate n (up to 8)
-    if n <= 8:
-        # consider permutations of pickups (not full event perms) and greedy drop handling
-        from itertools import permutations
-
-        ids = [p.id for p in passengers]
-        for perm in permutations(ids):
-            candidates.append(build_sequence_from_pickup_order(start, passengers, perm, drop_policy='defer_nearest'))
-            candidates.append(build_sequence_from_pickup_order(start, passengers, perm, drop_policy='immediate'))
-
-    # Evaluate candidates and track best for each objective
-    best = {
-        'min_avg_pickup_wait': None,
-        'min_max_pickup_wait': None,
-        'min_total_travel': None,
-        'min_avg_arrival_time': None,
-    }
-
-    def update_best(key: str, result: Dict):
-        cur = best[key]
-        if cur is None:
-            best[key] = result
-            return
-        # comparison depending on key, with sensible tie-breakers
-        if key == 'min_avg_pickup_wait':
-            if result['avg_pickup_wait'] < cur['avg_pickup_wait'] or (
-                math.isclose(result['avg_pickup_wait'], cur['avg_pickup_wait']) and result['total_travel'] < cur['total_travel']
-            ):
-                best[key] = result
-        elif key == 'min_max_pickup_wait':
-            # prefer smaller max pickup wait, then smaller average pickup wait, then smaller total travel
-            if (
-                result['max_pickup_wait'] < cur['max_pickup_wait']
-                or (
-                    result['max_pickup_wait'] == cur['max_pickup_wait']
-                    and (
-                        result['avg_pickup_wait'] < cur['avg_pickup_wait']
-                        or (math.isclose(result['avg_pickup_wait'], cur['avg_pickup_wait']) and result['total_travel'] < cur['total_travel'])
-                    )
-                )
-            ):
-                best[key] = result
-        elif key == 'min_total_travel':
-            if result['total_travel'] < cur['total_travel']:
-                best[key] = result
-        elif key == 'min_avg_arrival_time':
-            if result['avg_arrival_time'] < cur['avg_arrival_time'] or (
-                math.isclose(result['avg_arrival_time'], cur['avg_arrival_time']) and result['total_travel'] < cur['total_travel']
-            ):
-                best[key] = result
-
-    for seq in candidates:
-        metrics = simulate_events(seq, start, passengers)
-        # avoid duplicates: store only unique event lists by tuple
-        metrics['events'] = seq
-        update_best('min_avg_pickup_wait', metrics)
-        update_best('min_max_pickup_wait', metrics)
-        update_best('min_total_travel', metrics)
-        update_best('min_avg_arrival_time', metrics)
+        for seq in heuristics_for_large_n(start, floors):
+            candidates[tuple(seq)] = None
+        score_candidates(candidates, start, floors, best_keys, best_seqs)
+
+        # Also include sequences built from pickup permutations for moderate n (up to 8);
+        # below the exact limit the search has already seen every one of them
+        if n <= 8:
+            # consider permutations of pickups (not full event perms) and greedy drop handling,
+            # one chunk per first pickup, spread over worker processes when there is more than one core
+            workers = min(n, os.cpu_count() or 1)
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    chunks = list(pool.map(score_pickup_permutations, repeat(start), repeat(floors), range(n)))
+            else:
+                chunks = [score_pickup_permutations(start, floors, first) for first in range(n)]
+            # merge in chunk order with strict improvement, so tie-breaks match a serial pass
+            for chunk_keys, chunk_seqs in chunks:
+                for i, key in enumerate(chunk_keys):
+                    if key is not None and (best_keys[i] is None or key < best_keys[i]):
+                        best_keys[i] = key
+                        best_seqs[i] = chunk_seqs[i]
+
+        # The drop-tail memo is only useful within one scenario; don't keep its keys alive
+        greedy_drop_tail.cache_clear()
+
+    # Full metrics are only needed for the winners
+    best: Dict[str, Optional[Dict]] = {}
+    for name, seq in zip(OBJECTIVES, best_seqs):
+        best[name] = simulate_events(list(seq), start, floors) if seq is not None else None
 
     return best
 
 
 def format_events_readable(events: Sequence[Event], passengers: Sequence[Passenger], start: int) -> str:
-    name_map = {p.id: p.name or str(p.id) for p in passengers}
-
-    def ev_label(ev: Event) -> str:
-        typ, pid = ev
-        if typ == 'p':
-            floor = next(p.pickup for p in passengers if p.id == pid)
-            return f"{floor} (pickup {name_map[pid]})"
-        else:
-            floor = next(p.drop for p in passengers if p.id == pid)
-            return f"{floor} (drop {name_map[pid]})"
+    names = [p.name or str(p.id) for p in passengers]
 
-    return f"{start} → " + " → ".join(ev_label(e) for e in events)
+    parts = [str(start)]
+    parts.extend(
+        f"{passengers[ev >> 1].drop} (drop {names[ev >> 1]})" if ev & DROP else f"{passengers[ev >> 1].pickup} (pickup {names[ev >> 1]})"
+        for ev in events
+    )
+    return " → ".join(parts)
 
 
 def parse_passengers_from_args(arg_list: Sequence[str]) -> List[Passenger]:
@@ -305,6 +453,13 @@ def parse_passengers_from_args(arg_list: Sequence[str]) -> List[Passenger]:
     return passengers
 
 
+def read_line(prompt: str) -> str:
+    """Show prompt and return the line the user types, without surrounding whitespace."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
+
+
 def main(argv: Optional[Sequence[str]] = None) -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument('--start', '-s', type=int, default=None, help='elevator start floor (e.g. 5)')
@@ -315,13 +470,13 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     if args.start is None or not args.p:
         # interactive fallback
         print('Interactive mode — enter elevator start and passengers')
-        start = int(input('Elevator start floor: ').strip())
-        n = int(input('Number of passengers: ').strip())
+        start = int(read_line('Elevator start floor: '))
+        n = int(read_line('Number of passengers: '))
         passengers: List[Passenger] = []
         for i in range(n):
-            pickup = int(input(f'Passenger {i+1} pickup floor: ').strip())
-            drop = int(input(f'Passenger {i+1} drop floor: ').strip())
-            name = input(f'Passenger {i+1} name (optional): ').strip() or f'P{i+1}'
+            pickup = int(read_line(f'Passenger {i+1} pickup floor: '))
+            drop = int(read_line(f'Passenger {i+1} drop floor: '))
+            name = read_line(f'Passenger {i+1} name (optional): ') or f'P{i+1}'
             passengers.append(Passenger(id=i + 1, pickup=pickup, drop=drop, name=name))
     else:
         start = args.start
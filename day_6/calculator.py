@@ -2,96 +2,120 @@
 # This program performs basic math operations and logs everything to a file
 
 # Import the logging module - it helps us track what our program does
+import atexit
 import logging
+import sys
+from logging.handlers import MemoryHandler
+
+# The file handler writes to disk, which is slow if we do it for every message.
+# A MemoryHandler collects up to 100 messages and writes them in one go
+# (straight away if an ERROR comes in, and whatever is left when the program exits).
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+file_handler = logging.FileHandler('calculator.log')
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))  # basicConfig only formats the handlers it is given
+buffered_file_handler = MemoryHandler(capacity=100, flushLevel=logging.ERROR, target=file_handler)
+atexit.register(buffered_file_handler.flush)
 
 # Set up logging - this creates TWO outputs:
-# 1. A file called 'calculator.log' that saves everything
+# 1. A file called 'calculator.log' that saves everything (buffered, see above)
 # 2. Console output so we can still see messages on screen
 logging.basicConfig(
     level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('calculator.log'),  # Save to file
+        buffered_file_handler,  # Save to file
         logging.StreamHandler()  # Also show on screen
     ]
 )
 
+# Get our own logger once, instead of looking up the root logger on every logging.info() call.
+# Messages use %s placeholders instead of f-strings: the values are only filled in
+# if the message is actually going to be shown or saved.
+log = logging.getLogger("calc")
+log.setLevel(logging.DEBUG)
+
 # FUNCTIONS - These are reusable pieces of code!
 # Each function does ONE specific job
 
+def read_line(prompt):
+    """This function shows a question and returns the user's answer (one line, without extra spaces)"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
+
 def add(num1, num2):
     """This function adds two numbers together"""
     result = num1 + num2
-    logging.info(f"Calculation: {num1} + {num2} = {result}")
+    log.info("Calculation: %s + %s = %s", num1, num2, result)
     return result
 
 def subtract(num1, num2):
     """This function subtracts the second number from the first"""
     result = num1 - num2
-    logging.info(f"Calculation: {num1} - {num2} = {result}")
+    log.info("Calculation: %s - %s = %s", num1, num2, result)
     return result
 
 def multiply(num1, num2):
     """This function multiplies two numbers"""
     result = num1 * num2
-    logging.info(f"Calculation: {num1} × {num2} = {result}")
+    log.info("Calculation: %s × %s = %s", num1, num2, result)
     return result
 
 def divide(num1, num2):
     """This function divides the first number by the second"""
     if num2 == 0:
-        logging.error(f"Division by zero attempted: {num1} ÷ 0")
+        log.error("Division by zero attempted: %s ÷ 0", num1)
         return "ERROR: Can't divide by zero!"
     else:
         result = num1 / num2
-        logging.info(f"Calculation: {num1} ÷ {num2} = {result}")
+        log.info("Calculation: %s ÷ %s = %s", num1, num2, result)
         return result
 
 # MAIN PROGRAM STARTS HERE
-logging.info("="*40)
-logging.info("🧮 Calculator Program Started 🧮")
-logging.info("="*40)
+log.info("="*40)
+log.info("🧮 Calculator Program Started 🧮")
+log.info("="*40)
 
 # Step 1: Get the first number
-first_number = float(input("\nWhat's your first number? "))
-logging.debug(f"User entered first number: {first_number}")
+first_number = float(read_line("\nWhat's your first number? "))
+log.debug("User entered first number: %s", first_number)
 
 # Step 2: Ask which operation they want
-logging.info("Operations available: + - * /")
-operation = input("\nPick an operation (+, -, *, /): ")
-logging.debug(f"User selected operation: {operation}")
+log.info("Operations available: + - * /")
+operation = read_line("\nPick an operation (+, -, *, /): ")
+log.debug("User selected operation: %s", operation)
 
 # Step 3: Get the second number
-second_number = float(input("\nWhat's your second number? "))
-logging.debug(f"User entered second number: {second_number}")
+second_number = float(read_line("\nWhat's your second number? "))
+log.debug("User entered second number: %s", second_number)
 
 # Step 4: Call the right function based on the operation
 if operation == "+":
     answer = add(first_number, second_number)
-    logging.info(f"✓ Result: {answer}")
+    log.info("✓ Result: %s", answer)
 
 elif operation == "-":
     answer = subtract(first_number, second_number)
-    logging.info(f"✓ Result: {answer}")
+    log.info("✓ Result: %s", answer)
 
 elif operation == "*":
     answer = multiply(first_number, second_number)
-    logging.info(f"✓ Result: {answer}")
+    log.info("✓ Result: %s", answer)
 
 elif operation == "/":
     answer = divide(first_number, second_number)
     if "ERROR" not in str(answer):
-        logging.info(f"✓ Result: {answer}")
+        log.info("✓ Result: %s", answer)
     else:
-        logging.error(f"❌ {answer}")
+        log.error("❌ %s", answer)
 
 else:
-    logging.warning(f"Invalid operation entered: '{operation}' - Please use +, -, *, or /")
+    log.warning("Invalid operation entered: '%s' - Please use +, -, *, or /", operation)
 
 # Say goodbye
-logging.info("\nCalculator program ended successfully")
-logging.info("Check calculator.log for full history!")
-logging.info("="*40)
+log.info("\nCalculator program ended successfully")
+log.info("Check calculator.log for full history!")
+log.info("="*40)
 
 # LEARNING NOTES:
 # - We replaced ALL print() with logging statements
@@ -1,6 +1,7 @@
 import tkinter as tk
 import random
 import math
+import time
 
 class FlappyBird:
     def __init__(self):
@@ -18,6 +19,8 @@ class FlappyBird:
         self.PIPE_SPEED = 4
         self.PIPE_GAP = 180
         self.PIPE_WIDTH = 70
+        self.FRAME_TIME = 1 / 60  # seconds per game step (60 steps per second)
+        self.MAX_CATCH_UP = 5  # most game steps to run at once after a slow frame
         
         # Create canvas with gradient-like background
         self.canvas = tk.Canvas(
@@ -40,6 +43,8 @@ class FlappyBird:
         self.bird_angle = 0
         
         self.pipes = []
+        self.pipe_count = 0  # used to give each pipe its own canvas tag
+        self.pipe_pool = []  # off-screen pipes waiting to be reused
         self.score = 0
         self.high_score = 0
         self.frame_count = 0
@@ -47,6 +52,12 @@ class FlappyBird:
         self.game_started = False
         self.animation_offset = 0
         
+        # Wing flap: the wing sits at sin(frame * 0.3) * 3 pixels, which repeats every
+        # 21 frames (0.3 * 21 is almost exactly 2 * pi). Work out how far the wing moves
+        # on each of those frames once here, instead of calling math.sin twice per frame.
+        wing_heights = [math.sin(i * 0.3) * 3 for i in range(21)]
+        self.wing_steps = tuple(wing_heights[i] - wing_heights[i - 1] for i in range(21))
+        
         # Create first pipe
         self.add_pipe()
         
@@ -106,18 +117,24 @@ class FlappyBird:
         self.canvas.bind_all('<Button-1>', self.flap)
         
         # Start game loop
+        self.next_tick = time.perf_counter()  # when the next game step is due
         self.update()
         self.window.mainloop()
     
     def draw_background(self):
+        # Nothing in the background ever moves, so paint it all into ONE picture
+        # and show that as a single canvas item (instead of ~20 rectangles and ovals
+        # that Tk would have to keep track of on every frame)
+        self.background = tk.PhotoImage(width=self.WIDTH, height=self.HEIGHT)
+        
         # Sky gradient simulation with rectangles
         colors = ['#87CEEB', '#98D8E8', '#A9E2F3', '#BAF3FF']
         section_height = self.HEIGHT // len(colors)
         for i, color in enumerate(colors):
-            self.canvas.create_rectangle(
+            self.paint_rectangle(
                 0, i * section_height,
                 self.WIDTH, (i + 1) * section_height,
-                fill=color, outline=''
+                color
             )
         
         # Draw clouds
@@ -127,7 +144,7 @@ class FlappyBird:
         self.draw_cloud(400, 80, 55)
         
         # Draw sun
-        self.canvas.create_oval(
+        self.paint_oval(
             self.WIDTH - 120, 40,
             self.WIDTH - 40, 120,
             fill='#FFD700',
@@ -136,36 +153,70 @@ class FlappyBird:
         )
         
         # Ground/grass at bottom
-        self.canvas.create_rectangle(
+        self.paint_rectangle(
             0, self.HEIGHT - 100,
             self.WIDTH, self.HEIGHT,
-            fill='#7CB342',
-            outline=''
+            '#7CB342'
         )
-        self.canvas.create_rectangle(
+        self.paint_rectangle(
             0, self.HEIGHT - 100,
             self.WIDTH, self.HEIGHT - 95,
-            fill='#558B2F',
-            outline=''
+            '#558B2F'
         )
+        
+        # Show the finished picture (self.background must stay alive, or Tk forgets the image)
+        self.canvas.create_image(0, 0, image=self.background, anchor='nw')
+    
+    def paint_rectangle(self, x1, y1, x2, y2, color):
+        # Fill a rectangle of the background picture with one color
+        x1, y1 = max(0, round(x1)), max(0, round(y1))
+        x2, y2 = min(self.WIDTH, round(x2)), min(self.HEIGHT, round(y2))
+        if x2 > x1 and y2 > y1:
+            self.background.put(color, to=(x1, y1, x2, y2))
+    
+    def paint_oval(self, x1, y1, x2, y2, fill, outline='', width=1):
+        # Paint an oval into the background picture: a slightly bigger oval in the
+        # outline color first, then the inside in the fill color on top of it
+        if outline:
+            half = width / 2
+            self.paint_oval_rows(x1 - half, y1 - half, x2 + half, y2 + half, outline)
+            self.paint_oval_rows(x1 + half, y1 + half, x2 - half, y2 - half, fill)
+        else:
+            self.paint_oval_rows(x1, y1, x2, y2, fill)
+    
+    def paint_oval_rows(self, x1, y1, x2, y2, color):
+        # An oval is painted one row of pixels at a time: for each row, work out
+        # how wide the oval is there and fill that strip
+        center_x = (x1 + x2) / 2
+        center_y = (y1 + y2) / 2
+        radius_x = (x2 - x1) / 2
+        radius_y = (y2 - y1) / 2
+        if radius_x <= 0 or radius_y <= 0:
+            return
+        for y in range(max(0, math.floor(y1)), min(self.HEIGHT, math.ceil(y2))):
+            dy = (y + 0.5 - center_y) / radius_y
+            if abs(dy) >= 1:
+                continue
+            half_width = radius_x * math.sqrt(1 - dy * dy)
+            self.paint_rectangle(center_x - half_width, y, center_x + half_width, y + 1, color)
     
     def draw_cloud(self, x, y, size):
         # Draw fluffy cloud
-        self.canvas.create_oval(
+        self.paint_oval(
             x, y,
             x + size, y + size * 0.6,
             fill='white',
             outline='#E0E0E0',
             width=1
         )
-        self.canvas.create_oval(
+        self.paint_oval(
             x + size * 0.3, y - size * 0.2,
             x + size * 0.8, y + size * 0.5,
             fill='white',
             outline='#E0E0E0',
             width=1
         )
-        self.canvas.create_oval(
+        self.paint_oval(
             x + size * 0.5, y,
             x + size * 1.2, y + size * 0.6,
             fill='white',
@@ -174,6 +225,8 @@ class FlappyBird:
         )
     
     def create_bird(self):
+        # Every part except the wing gets the 'bird' tag, so during the game they can all
+        # be moved with one canvas call (the wing flaps, so it is placed on its own)
         # Bird body (main circle)
         self.bird_body = self.canvas.create_oval(
             self.bird_x - self.bird_radius,
@@ -182,7 +235,8 @@ class FlappyBird:
             self.bird_y + self.bird_radius,
             fill='#FFD700',
             outline='#FFA500',
-            width=3
+            width=3,
+            tags='bird'
         )
         
         # Bird belly (lighter shade)
@@ -192,7 +246,8 @@ class FlappyBird:
             self.bird_x + self.bird_radius // 2,
             self.bird_y + self.bird_radius // 2,
             fill='#FFEB3B',
-            outline=''
+            outline='',
+            tags='bird'
         )
         
         # Wing
@@ -214,7 +269,8 @@ class FlappyBird:
             self.bird_y + 2,
             fill='white',
             outline='black',
-            width=2
+            width=2,
+            tags='bird'
         )
         
         # Eye pupil
@@ -223,7 +279,8 @@ class FlappyBird:
             self.bird_y - 5,
             self.bird_x + 11,
             self.bird_y - 1,
-            fill='black'
+            fill='black',
+            tags='bird'
         )
         
         # Beak
@@ -239,87 +296,125 @@ class FlappyBird:
             beak_points,
             fill='#FF6347',
             outline='#CC4125',
-            width=2
+            width=2,
+            tags='bird'
         )
     
-    def add_pipe(self):
-        height = random.randint(120, self.HEIGHT - self.PIPE_GAP - 220)
+    def create_pipe_items(self):
+        # Make the six rectangles of one pipe. Where they go is set by position_pipe,
+        # so a pipe can be reused (moved back to the right) instead of deleted and redrawn.
+        # All six share the pipe's own tag, plus the 'pipes' tag that every pipe on screen has,
+        # so all pipes can be moved together with a single canvas call.
+        self.pipe_count += 1
+        tag = f'pipe{self.pipe_count}'
         
         # Top pipe main body
         top_pipe = self.canvas.create_rectangle(
-            self.WIDTH,
-            0,
-            self.WIDTH + self.PIPE_WIDTH,
-            height,
+            0, 0, 0, 0,
             fill='#4CAF50',
             outline='#2E7D32',
-            width=3
+            width=3,
+            tags=(tag, 'pipes')
         )
         
         # Top pipe highlight (3D effect)
         top_highlight = self.canvas.create_rectangle(
-            self.WIDTH + 5,
-            5,
-            self.WIDTH + 15,
-            height - 35,
+            0, 0, 0, 0,
             fill='#66BB6A',
-            outline=''
+            outline='',
+            tags=(tag, 'pipes')
         )
         
         # Top pipe cap
         top_cap = self.canvas.create_rectangle(
-            self.WIDTH - 8,
-            height - 35,
-            self.WIDTH + self.PIPE_WIDTH + 8,
-            height,
+            0, 0, 0, 0,
             fill='#66BB6A',
             outline='#2E7D32',
-            width=3
+            width=3,
+            tags=(tag, 'pipes')
         )
         
         # Bottom pipe main body
         bottom_pipe = self.canvas.create_rectangle(
-            self.WIDTH,
-            height + self.PIPE_GAP,
-            self.WIDTH + self.PIPE_WIDTH,
-            self.HEIGHT - 100,
+            0, 0, 0, 0,
             fill='#4CAF50',
             outline='#2E7D32',
-            width=3
+            width=3,
+            tags=(tag, 'pipes')
         )
         
         # Bottom pipe highlight
         bottom_highlight = self.canvas.create_rectangle(
-            self.WIDTH + 5,
-            height + self.PIPE_GAP + 35,
-            self.WIDTH + 15,
-            self.HEIGHT - 105,
+            0, 0, 0, 0,
             fill='#66BB6A',
-            outline=''
+            outline='',
+            tags=(tag, 'pipes')
         )
         
         # Bottom pipe cap
         bottom_cap = self.canvas.create_rectangle(
-            self.WIDTH - 8,
-            height + self.PIPE_GAP,
-            self.WIDTH + self.PIPE_WIDTH + 8,
-            height + self.PIPE_GAP + 35,
+            0, 0, 0, 0,
             fill='#66BB6A',
             outline='#2E7D32',
-            width=3
+            width=3,
+            tags=(tag, 'pipes')
         )
         
-        self.pipes.append({
+        return {
+            'tag': tag,
             'top': top_pipe,
             'top_highlight': top_highlight,
             'top_cap': top_cap,
             'bottom': bottom_pipe,
             'bottom_highlight': bottom_highlight,
-            'bottom_cap': bottom_cap,
-            'x': self.WIDTH,
-            'height': height,
-            'passed': False
-        })
+            'bottom_cap': bottom_cap
+        }
+    
+    def position_pipe(self, pipe, x, height):
+        # Put all six rectangles of the pipe in place, with the gap starting at height
+        self.canvas.coords(pipe['top'], x, 0, x + self.PIPE_WIDTH, height)
+        self.canvas.coords(pipe['top_highlight'], x + 5, 5, x + 15, height - 35)
+        self.canvas.coords(pipe['top_cap'], x - 8, height - 35, x + self.PIPE_WIDTH + 8, height)
+        self.canvas.coords(
+            pipe['bottom'],
+            x, height + self.PIPE_GAP,
+            x + self.PIPE_WIDTH, self.HEIGHT - 100
+        )
+        self.canvas.coords(
+            pipe['bottom_highlight'],
+            x + 5, height + self.PIPE_GAP + 35,
+            x + 15, self.HEIGHT - 105
+        )
+        self.canvas.coords(
+            pipe['bottom_cap'],
+            x - 8, height + self.PIPE_GAP,
+            x + self.PIPE_WIDTH + 8, height + self.PIPE_GAP + 35
+        )
+        pipe['x'] = x
+        pipe['height'] = height
+        pipe['passed'] = False
+    
+    def retire_pipe(self, pipe):
+        # Park the pipe far off the left edge and keep it for the next add_pipe.
+        # It leaves the 'pipes' group, so the per-frame move skips it.
+        self.canvas.move(pipe['tag'], -2 * self.WIDTH, 0)
+        self.canvas.dtag(pipe['tag'], 'pipes')
+        self.pipe_pool.append(pipe)
+    
+    def add_pipe(self):
+        height = random.randint(120, self.HEIGHT - self.PIPE_GAP - 220)
+        
+        # Reuse a pipe that went off screen if there is one
+        if self.pipe_pool:
+            pipe = self.pipe_pool.pop()
+            # Bring it back to the top of the drawing order, like a freshly drawn pipe,
+            # and back into the 'pipes' group
+            self.canvas.tag_raise(pipe['tag'])
+            self.canvas.addtag_withtag('pipes', pipe['tag'])
+        else:
+            pipe = self.create_pipe_items()
+        self.position_pipe(pipe, self.WIDTH, height)
+        self.pipes.append(pipe)
     
     def flap(self, event=None):
         if not self.game_started:
@@ -340,14 +435,9 @@ class FlappyBird:
         self.bird_angle = 0
         self.update_bird_position()
         
-        # Remove all pipes
+        # Remove all pipes (they are kept for reuse)
         for pipe in self.pipes:
-            self.canvas.delete(pipe['top'])
-            self.canvas.delete(pipe['top_highlight'])
-            self.canvas.delete(pipe['top_cap'])
-            self.canvas.delete(pipe['bottom'])
-            self.canvas.delete(pipe['bottom_highlight'])
-            self.canvas.delete(pipe['bottom_cap'])
+            self.retire_pipe(pipe)
         self.pipes = []
         self.add_pipe()
         
@@ -397,19 +487,21 @@ class FlappyBird:
             fill='white'
         )
     
-    def check_collision(self, pipe):
-        bird_left = self.bird_x - self.bird_radius
-        bird_right = self.bird_x + self.bird_radius
-        bird_top = self.bird_y - self.bird_radius
-        bird_bottom = self.bird_y + self.bird_radius
-        
-        pipe_left = pipe['x']
-        pipe_right = pipe['x'] + self.PIPE_WIDTH
-        
-        if bird_right > pipe_left and bird_left < pipe_right:
-            if bird_top < pipe['height'] or bird_bottom > pipe['height'] + self.PIPE_GAP:
-                return True
-        return False
+    def update_bird_box(self):
+        # The bird's hitbox: left, top, right, bottom
+        self.bird_box = (
+            self.bird_x - self.bird_radius,
+            self.bird_y - self.bird_radius,
+            self.bird_x + self.bird_radius,
+            self.bird_y + self.bird_radius
+        )
+    
+    def outside_gap(self, pipe):
+        # True if the bird sticks out above or below the pipe's gap
+        # (only a hit if the bird is also level with the pipe from left to right,
+        # which step_game checks first with its hit_left/hit_right window)
+        top, bottom = self.bird_box[1], self.bird_box[3]
+        return top < pipe['height'] or bottom > pipe['height'] + self.PIPE_GAP
     
     def update_bird_position(self):
         # Update all bird parts
@@ -461,61 +553,101 @@ class FlappyBird:
         self.canvas.coords(self.bird_beak, *beak_points)
     
     def update(self):
-        if self.game_started and not self.game_over:
-            # Update bird physics
-            self.bird_vel += self.GRAVITY
-            self.bird_y += self.bird_vel
-            
-            # Update bird position
-            self.update_bird_position()
-            
-            # Animate wing flap
-            self.animation_offset += 1
-            wing_y_offset = math.sin(self.animation_offset * 0.3) * 3
-            self.canvas.move(self.bird_wing, 0, wing_y_offset - (math.sin((self.animation_offset - 1) * 0.3) * 3))
+        # Run one game step for every frame that is due by now. If the computer was slow,
+        # this catches up (a few steps at once) so the game speed doesn't depend on how
+        # long each frame took to draw.
+        now = time.perf_counter()
+        steps = 0
+        while self.next_tick <= now and steps < self.MAX_CATCH_UP:
+            if self.game_started and not self.game_over:
+                self.step_game()
+            self.next_tick += self.FRAME_TIME
+            steps += 1
+        if self.next_tick <= now:
+            # Too far behind (e.g. the window was dragged): skip ahead instead of rushing
+            self.next_tick = now + self.FRAME_TIME
+        
+        # Continue game loop: wait until the next step is due
+        # (rounded up, so we never wake up a moment too early with nothing to do)
+        delay_ms = max(0, math.ceil((self.next_tick - time.perf_counter()) * 1000))
+        self.window.after(delay_ms, self.update)
+    
+    def step_game(self):
+        # One step of the game: bird physics, wing, pipes, collisions and score
+        # Update bird physics
+        self.bird_vel += self.GRAVITY
+        self.bird_y += self.bird_vel
+        
+        # Update bird position: the bird only moves up and down, so shift all the 'bird'
+        # parts by this step's speed at once, then put the wing back under the body
+        self.canvas.move('bird', 0, self.bird_vel)
+        self.canvas.coords(
+            self.bird_wing,
+            self.bird_x - 8,
+            self.bird_y - 3,
+            self.bird_x + 10,
+            self.bird_y + 12
+        )
+        
+        # Animate wing flap
+        self.animation_offset += 1
+        self.canvas.move(self.bird_wing, 0, self.wing_steps[self.animation_offset % 21])
+        
+        # Work out the bird's hitbox once for this step (every pipe check below reuses it)
+        self.update_bird_box()
+        
+        # Check ceiling and floor collision
+        if self.bird_box[1] <= 0 or self.bird_box[3] >= self.HEIGHT - 100:
+            self.end_game()
+        
+        # Update pipes
+        self.frame_count += 1
+        if self.frame_count % 85 == 0:
+            self.add_pipe()
+        
+        # Look these up once per frame instead of once per pipe
+        # (local variables are faster to read than self.something)
+        retire_pipe = self.retire_pipe
+        itemconfig = self.canvas.itemconfig
+        speed = self.PIPE_SPEED
+        pipe_width = self.PIPE_WIDTH
+        bird_x = self.bird_x
+        pipes = self.pipes
+        
+        # A pipe can only touch the bird while its left edge is between these two x values,
+        # so pipes further away skip the full collision check
+        hit_left = self.bird_box[0] - pipe_width
+        hit_right = self.bird_box[2]
+        
+        # Every pipe moves left by the same amount, so move them all at once
+        self.canvas.move('pipes', -speed, 0)
+        
+        # Pipes that are still on screen get packed to the front of the list as we go
+        # (keep counts how many), so we never copy the list or search it with remove()
+        keep = 0
+        for pipe in pipes:
+            # Keep track of where the pipe is now (used for collisions and scoring)
+            pipe['x'] -= speed
             
-            # Check ceiling and floor collision
-            if self.bird_y - self.bird_radius <= 0 or self.bird_y + self.bird_radius >= self.HEIGHT - 100:
+            # Check collision: the bird hits a pipe if it is level with it from left to right
+            # (the window above) AND it is above or below the gap
+            if hit_left < pipe['x'] < hit_right and self.outside_gap(pipe):
                 self.end_game()
             
-            # Update pipes
-            self.frame_count += 1
-            if self.frame_count % 85 == 0:
-                self.add_pipe()
+            # Update score
+            if not pipe['passed'] and pipe['x'] + pipe_width < bird_x:
+                pipe['passed'] = True
+                self.score += 1
+                itemconfig(self.score_text, text=str(self.score))
+                itemconfig(self.score_shadow, text=str(self.score))
             
-            for pipe in self.pipes[:]:
-                # Move pipe
-                pipe['x'] -= self.PIPE_SPEED
-                self.canvas.move(pipe['top'], -self.PIPE_SPEED, 0)
-                self.canvas.move(pipe['top_highlight'], -self.PIPE_SPEED, 0)
-                self.canvas.move(pipe['top_cap'], -self.PIPE_SPEED, 0)
-                self.canvas.move(pipe['bottom'], -self.PIPE_SPEED, 0)
-                self.canvas.move(pipe['bottom_highlight'], -self.PIPE_SPEED, 0)
-                self.canvas.move(pipe['bottom_cap'], -self.PIPE_SPEED, 0)
-                
-                # Check collision
-                if self.check_collision(pipe):
-                    self.end_game()
-                
-                # Update score
-                if not pipe['passed'] and pipe['x'] + self.PIPE_WIDTH < self.bird_x:
-                    pipe['passed'] = True
-                    self.score += 1
-                    self.canvas.itemconfig(self.score_text, text=str(self.score))
-                    self.canvas.itemconfig(self.score_shadow, text=str(self.score))
-                
-                # Remove off-screen pipes
-                if pipe['x'] + self.PIPE_WIDTH < 0:
-                    self.canvas.delete(pipe['top'])
-                    self.canvas.delete(pipe['top_highlight'])
-                    self.canvas.delete(pipe['top_cap'])
-                    self.canvas.delete(pipe['bottom'])
-                    self.canvas.delete(pipe['bottom_highlight'])
-                    self.canvas.delete(pipe['bottom_cap'])
-                    self.pipes.remove(pipe)
-        
-        # Continue game loop
-        self.window.after(16, self.update)
+            # Remove off-screen pipes (they are kept for reuse)
+            if pipe['x'] + pipe_width < 0:
+                retire_pipe(pipe)
+            else:
+                pipes[keep] = pipe
+                keep += 1
+        del pipes[keep:]
     
     def end_game(self):
         self.game_over = True